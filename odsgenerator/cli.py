@@ -6,26 +6,75 @@
 
 import argparse
 import sys
-
-import odfdo
-
-from odsgenerator.odsgenerator import __doc__, __version__, file_to_ods
+from functools import lru_cache
 
 ODFDO_REQUIREMENT = (3, 5, 0)
+ODFDO_REQUIREMENT_STR = ".".join(str(x) for x in ODFDO_REQUIREMENT)
 
 
+@lru_cache(maxsize=1)
 def check_odfdo_version():
-    """Utility to verify we have the minimal version of the odfdo library."""
+    """Utility to verify we have the minimal version of the odfdo library.
+
+    The odfdo version is only parsed on the first call.
+    """
+    import odfdo
+
     if tuple(int(x) for x in odfdo.__version__.split(".")) >= ODFDO_REQUIREMENT:
         return True
     print(  # pragma: no cover
-        "Error: odfdo version >= "
-        f"{'.'.join(str(x) for x in ODFDO_REQUIREMENT)} is required"
+        f"Error: odfdo version >= {ODFDO_REQUIREMENT_STR} is required"
     )
     return False  # pragma: no cover
 
 
-def main():  # pragma: no cover
+class _ExitAction(argparse.Action):
+    """Base of the actions printing some text and exiting, like --help."""
+
+    default_help = None
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help=None,  # noqa: A002
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help or self.default_help,
+        )
+
+
+class _LazyVersion(_ExitAction):
+    """Version action importing the odsgenerator version only when called."""
+
+    default_help = "show program's version number and exit"
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from odsgenerator.about import __version__
+
+        print(f"{parser.prog} {__version__}")
+        parser.exit()
+
+
+class _LazyHelp(_ExitAction):
+    """Help action importing the long documentation only when called."""
+
+    default_help = "show this help message and exit"
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from odsgenerator.about import __doc__ as epilog
+
+        parser.epilog = epilog
+        parser.print_help()
+        parser.exit()
+
+
+def main(argv=None):
     """Read parameters from STDIN and apply the required command.
 
     Usage:
@@ -38,24 +87,29 @@ def main():  # pragma: no cover
 
     Use `odsgenerator --help` for more details about input file parameters
     and look at examples in the tests folder.
+
+    Args:
+        argv (list): Command line arguments, default to sys.argv[1:].
     """
-    if not check_odfdo_version():
-        sys.exit(1)
     parser = argparse.ArgumentParser(
+        prog="odsgenerator",
         description="odsgenerator, an .ods generator.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
-    parser.add_argument(
-        "--version", action="version", version="%(prog)s " + __version__
+        add_help=False,
     )
+    parser.add_argument("-h", "--help", action=_LazyHelp)
+    parser.add_argument("--version", action=_LazyVersion)
     parser.add_argument(
         "input_file", help="input file containing data in json or yaml format"
     )
     parser.add_argument(
         "output_file", help="output file, .ods file generated from input"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if not check_odfdo_version():
+        sys.exit(1)  # pragma: no cover
+    from odsgenerator.odsgenerator import file_to_ods
+
     file_to_ods(args.input_file, args.output_file)
 
 
@@ -1,195 +1,25 @@
 # Copyright 2021-2024 Jérôme Dumonteil
 # Licence: MIT
 # Authors: jerome.dumonteil@gmail.com
-"""Generate an OpenDocument Format .ods file from json or yaml file.
-
-When used as a script, odsgenerator parses a JSON or YAML description of
-tables and generates an ODF document using the odfdo library.
-
-When used as a library, odsgenerator parses a python description of tables
-and returns the ODF content as bytes.
-
-    -  description can be minimalist: a list of lists of lists,
-    -  description can be complex, allowing styles at row or cell level.
-
-See also https://github.com/jdum/odsparsator which is doing the reverse
-operation, ods => json.
-
-
-Usage
------
-
-   odsgenerator [-h] [--version] input_file output_file
-
-
-Arguments
----------
-
-input_file: input file containing data in json or yaml format
-
-output_file: output file, .ods file generated from input
-
-Use `odsgenerator --help` for more details about input file parameters
-and look at examples in the tests folder.
-
-
-From python code
-----------------
-
-    import odsgenerator
-    raw = odsgenerator.ods_bytes([[["a", "b", "c"], [10, 20, 30]]])
-    with open("sample1.ods", "wb") as f:
-        f.write(raw)
-
-Another example with more parameters:
-
-    raw = odsgenerator.ods_bytes(
-        [
-            {
-                "name": "first tab",
-                "style": "cell_decimal2",
-                "table": [
-                    {
-                        "row": ["a", "b", "c"],
-                        "style": "bold_center_bg_gray_grid_06pt",
-                    },
-                    [10, 20, 30],
-                ],
-            }
-        ]
-    )
-    with open("sample2.ods", "wb") as f:
-        f.write(raw)
-
-
-Principle
----------
-
--  a document is a list or dict containing tabs,
--  a tab is a list or dict containing rows,
--  a row is a list or dict containing cells.
-
-
-A cell can be:
-    - int, float or str
-    - a dict, with the following keys (only the 'value' key is mandatory):
-        - value: int, float or str,
-        - style: str or list of str, a style name or a list of style names,
-        - text: str, a string representation of the value (for ODF readers
-          who use it),
-        - formula: str, content of the 'table:formula' attribute, some "of:"
-          OpenFormula string,
-        - colspanned: int, the number of spanned columns,
-        - rowspanned: int, the number of spanned rows.
-
-A row can be:
-    - a list of cells,
-    - a dict, with the following keys (only the 'row' key is mandatory):
-        - row: a list of cells, see above,
-        - style: str or list of str, a style name or a list of style names.
-
-A tab can be:
-    - a list of rows,
-    - a dict, with the following keys (only the 'table' key is mandatory):
-        - table: a list of rows,
-        - width: a list containing the width of each column of the table,
-        - name: str, the name of the tab,
-        - style: str or list of str, a style name or a list of style names.
-
-A tab may have some post transformation:
-    - a list of span areas, cell coordinates are defined in the tab after
-      its creation using odfo method Table.set_span(), with either
-      coordiante system: "A1:B3" or [0, 0, 2, 1].
-
-A document can be:
-    - a list of tabs,
-    - a dict, with the following keys (only the 'body' key is mandatory):
-        - body: a list of tabs,
-        - styles: a list of dict of styles definitions,
-        - defaults: a dict, for the defaults styles.
-
-A style definition is a dict with 2 items:
-    - name: str, the name of the style (optional, if not present the
-      attribute style:name of the definition is used),
-    - an XML definition of the ODF style, see list below.
-
-The styles provided for a row or a table can be of family table-row or
-table-cell, they apply to row and below cells. A style defined at a
-lower level (cell for instance) has priority over the style defined above
-(row for instance).
-
-In short, if you don't need custom styles, this is a valid document
-description:
-    [ [ ["a", "b", "c" ] ] ]
-
-This list will create a document with only one tab (name will be "Tab 1"
-by default), containing one row of 3 values "a", "b", "c".
-
-
-Styles
-------
-
-Styles are XML strings of OpenDocument styles. They can be extracted from the
-content.xml part of an existing .ods document.
-
-    - The DEFAULT_STYLES constant defines styles always available, they can be
-      called by their name for cells or rows.
-    - To add a custom style, use the "styles" category of the document dict.
-      A style is a dict with 2 keys, "definition" and "name".
-
-List of provided styles:
-
-    - 'grid_06pt' means that the cell is surrounded by a black border of 0.6
-      point,
-    - 'gray' means that the cell has a gray background.
-    - The file doc/styles.ods displays all the styles provided.
-
-Row styles:
-    - default_table_row
-    - table_row_1cm
-Cell styles:
-    - bold
-    - bold_center
-    - left
-    - right
-    - center
-    - cell_decimal1
-    - cell_decimal2
-    - cell_decimal3
-    - cell_decimal4
-    - cell_decimal6
-    - grid_06pt
-    - bold_left_bg_gray_grid_06pt
-    - bold_right_bg_gray_grid_06pt
-    - bold_center_bg_gray_grid_06pt
-    - bold_left_grid_06pt
-    - bold_right_grid_06pt
-    - bold_center_grid_06pt
-    - left_grid_06pt
-    - right_grid_06pt
-    - center_grid_06pt
-    - integer_grid_06pt
-    - integer_no_zero_grid_06pt
-    - center_integer_no_zero_grid_06pt
-    - decimal1_grid_06pt
-    - decimal2_grid_06pt
-    - decimal3_grid_06pt
-    - decimal4_grid_06pt
-    - decimal6_grid_06pt
-"""
 
 import io
-import sys
-
-try:  # noqa: SIM105
-    import yaml
-except ModuleNotFoundError:  # pragma: no cover
-    pass
 import json
+import re
+import sys
+import threading
+import warnings
+import zipfile
+from functools import lru_cache
+from types import MappingProxyType
 
 from odfdo import Cell, Document, Element, Row, Table
 
-__version__ = "1.11.1"
+from odsgenerator import about
+
+# the documentation and version live in odsgenerator.about, so that the CLI
+# can print them without importing odfdo
+__doc__ = about.__doc__
+__version__ = about.__version__
 
 DEFAULT_STYLES = [
     {
@@ -640,6 +470,7 @@ FORMULA = "formula"
 COLSPAN = "colspanned"
 ROWSPAN = "rowspanned"
 TEXT = "text"
+ATTR = "attr"
 NAME = "name"
 DEFINITION = "definition"
 WIDTH = "width"
@@ -648,6 +479,96 @@ STYLE = "style"
 STYLES = "styles"
 DEFAULTS = "defaults"
 DEFAULT_TAB_PREFIX = "Tab"
+# read-only options of items described without a dict, like bare values
+_EMPTY_OPT = MappingProxyType({})
+# keys allowed in the description of an empty cell, merged with its neighbours
+_EMPTY_CELL_KEYS = frozenset((VALUE, STYLE))
+# marker of a cell that cannot be merged (None is a valid style name)
+_NOT_EMPTY = object()
+
+# remove the indentation between tags of the definitions
+DEFAULT_STYLES = [
+    {
+        NAME: style[NAME],
+        DEFINITION: re.sub(r">\s+<", "><", style[DEFINITION].strip()),
+    }
+    for style in DEFAULT_STYLES
+]
+
+
+def style_element(style_item):
+    """Build the ODF style element of a style definition.
+
+    Args:
+        style_item (dict): Style definition, with "definition" and optional
+            "name" keys.
+
+    Returns:
+        tuple: name of the style, style Element.
+    """
+    name = style_item.get(NAME)
+    style = Element.from_tag(style_item.get(DEFINITION))
+    if name:
+        style.name = name
+    else:
+        name = style.name
+    return name, style
+
+
+def intern_name(name):
+    """Intern a style name, so that dict lookups compare it by identity.
+
+    sys.intern() only accepts exact str instances, names of a str subclass
+    (like numpy.str_) are returned unchanged.
+
+    Args:
+        name (str): Name of a style.
+
+    Returns:
+        str: The interned name.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
+# default styles are parsed once, a copy is inserted in each document
+_DEFAULT_STYLES_LOCK = threading.Lock()
+_default_styles = None
+
+
+def default_styles():
+    """Return the elements of DEFAULT_STYLES, parsed on first call.
+
+    The elements are parsed under a lock and published only once complete,
+    so generators created concurrently never see a partial set.
+
+    Returns:
+        tuple: dict of style elements by name, dict of such dicts by family.
+    """
+    global _default_styles
+    if _default_styles is None:
+        with _DEFAULT_STYLES_LOCK:
+            if _default_styles is None:
+                elements = {}
+                by_family = {}
+                for item in DEFAULT_STYLES:
+                    name, style = style_element(item)
+                    name = intern_name(name)
+                    elements[name] = style
+                    by_family.setdefault(style.family, {})[name] = style
+                _default_styles = (elements, by_family)
+    return _default_styles
+
+
+@lru_cache(maxsize=1)
+def spreadsheet_template():
+    """Return the empty spreadsheet document cloned by the generators.
+
+    Returns:
+        Document: The odfdo spreadsheet template, loaded once.
+    """
+    return Document("spreadsheet")
 
 
 class ODSGenerator:
@@ -662,12 +583,17 @@ class ODSGenerator:
     """
 
     def __init__(self, content):
-        self.doc = Document("spreadsheet")
-        self.doc.body.clear()
+        self.doc = spreadsheet_template().clone
+        self.body = self.doc.body
+        self.body.clear()
         self.tab_counter = 0
-        self.defaults = DEFAULTS_DICT
+        self.defaults = dict(DEFAULTS_DICT)
         self.styles_elements = {}
+        self.styles_by_family = {}
         self.used_styles = set()
+        self.guessed_styles = {}
+        self.type_styles = {}
+        self.width_styles = {}
         self.spanned_cells = []
         self.parse(content)
 
@@ -684,38 +610,65 @@ class ODSGenerator:
 
         Args:
             styles (list): List of styles definitions.
-            insert (bool): Force inseerti in document.
+            insert (bool): Force insertion in document.
         """
         if not styles:
             return
-        for style_item in styles:
-            name = style_item.get(NAME)
-            definition = style_item.get(DEFINITION)
-            style = Element.from_tag(definition)
-            if name:
-                style.name = name
+        self.guessed_styles.clear()
+        if styles is DEFAULT_STYLES and not insert:
+            elements, by_family = default_styles()
+            if self.styles_elements:
+                for name, style in elements.items():
+                    self.add_style(name, style)
             else:
-                name = style.name
-            self.styles_elements[name] = style
+                # copy the prebuilt indexes in one step
+                self.styles_elements = dict(elements)
+                self.styles_by_family = {
+                    family: dict(styles) for family, styles in by_family.items()
+                }
+            return
+        for style_item in styles:
+            name, style = style_element(style_item)
+            self.add_style(name, style)
             if insert:
                 self.insert_style(name)
 
+    def add_style(self, name, style):
+        """Register a style element as available, indexed by its family.
+
+        Args:
+            name (str): Name of the style.
+            style (Element): The style element.
+        """
+        name = intern_name(name)
+        previous = self.styles_elements.get(name)
+        if previous is not None:
+            self.styles_by_family[previous.family].pop(name, None)
+        self.styles_elements[name] = style
+        self.styles_by_family.setdefault(style.family, {})[name] = style
+
     def insert_style(self, name, automatic=True):
         """Insert the named style into the ODF document."""
-        if name and name not in self.used_styles and name in self.styles_elements:
-            style = self.styles_elements[name]
-            self.doc.insert_style(style, automatic=automatic)
-            self.used_styles.add(name)
-            # add style dependacies
-            for key, value in style.attributes.items():
-                if key.endswith("style-name"):
-                    self.insert_style(value)
+        if not name or name in self.used_styles:
+            return
+        style = self.styles_elements.get(name)
+        if style is None:
+            return
+        if style is default_styles()[0].get(name):
+            style = style.clone
+        self.doc.insert_style(style, automatic=automatic)
+        self.used_styles.add(name)
+        # add style dependacies
+        for key, value in style.attributes.items():
+            if key.endswith("style-name"):
+                self.insert_style(value)
 
     def guess_style(self, opt, family, default):
         """Guess which style to apply.
 
         Search list of styles under the "style" key, check against family of
-        style, apply default if none found.
+        style, apply default if none found. Results are cached by style list,
+        family and default.
 
         Args:
             opt (dict): Part of input description.
@@ -726,43 +679,71 @@ class ODSGenerator:
             str or None: Name of he style to apply.
         """
         style_list = opt.get(STYLE, [])
-        if not isinstance(style_list, list):
-            style_list = [style_list]
+        if isinstance(style_list, list):
+            style_list = tuple(style_list)
+        else:
+            style_list = (style_list,)
+        key = (style_list, family, default)
+        guessed_styles = self.guessed_styles
+        try:
+            return guessed_styles[key]
+        except KeyError:
+            style = self.resolve_style(style_list, family, default)
+            guessed_styles[key] = style
+            return style
+
+    def resolve_style(self, style_list, family, default):
+        """Find the first style of the list matching the family, or default.
+
+        Args:
+            style_list (tuple): Style names.
+            family (str): ODF family style.
+            default (str): Default style name.
+
+        Returns:
+            str or None: Name of he style to apply, interned like the names
+            of the registered styles.
+        """
+        styles = self.styles_by_family.get(family, {})
         for style_name in style_list:
-            if style_name:
-                style = self.styles_elements.get(style_name)
-                if style and style.family == family:
-                    return style_name
-        if default:
-            style = self.styles_elements.get(default)
-            if style and style.family == family:
-                return default
+            if style_name and style_name in styles:
+                return intern_name(style_name)
+        if default and default in styles:
+            return intern_name(default)
         return None
 
     @staticmethod
     def split(item, key):
         """Extract the value of the key if item is a dict.
 
-        If item is a dict, pop the value from the key, else consider that item
-        is already the response.
+        If item is a dict, get the value from the key, else consider that item
+        is already the response. The item is not modified, so the same input
+        description can be parsed several times.
 
         Args:
             item (any type): Part of input description.
             key (str): Key to extract.
 
         Returns:
-            tuple: extracted content, remaining dict.
+            tuple: extracted content, options dict.
         """
         if isinstance(item, dict):
-            inner = item.pop(key, [])
-            return (inner, item)
+            return (item.get(key, []), item)
         # item can be list or value, or None
-        return (item, {})
+        return (item, _EMPTY_OPT)
 
     def parse(self, content):
         """Parse the top level of the input description."""
         body, opt = self.split(content, BODY)
         self.defaults.update(opt.get(DEFAULTS, {}))
+        # default cell style for the exact type of the most common values
+        self.type_styles = {
+            type(None): self.defaults["style_str"],
+            str: self.defaults["style_str"],
+            bool: self.defaults["style_int"],
+            int: self.defaults["style_int"],
+            float: self.defaults["style_float"],
+        }
         self.parse_styles(DEFAULT_STYLES)
         self.parse_styles(opt.get(STYLES), insert=True)
         for table_content in body:
@@ -773,6 +754,9 @@ class ODSGenerator:
         rows, opt = self.split(table_content, TABLE)
         self.tab_counter += 1
         table = Table(opt.get(NAME, f"{DEFAULT_TAB_PREFIX} {self.tab_counter}"))
+        # insert the table before its rows: lxml moving a large subtree into
+        # the document is quadratic in its number of elements
+        self.body.append(table)
         style_table_row = self.guess_style(
             opt, "table-row", self.defaults["style_table_row"]
         )
@@ -780,69 +764,130 @@ class ODSGenerator:
             opt, "table-cell", self.defaults["style_table_cell"]
         )
         self.spanned_cells = []  # spanned_cells is relative to this table
-        for row_content in rows:
-            self.parse_row(table, row_content, style_table_row, style_table_cell)
+        parse_row = self._parse_row
+        table.extend_rows(
+            [
+                parse_row(y, row_content, style_table_row, style_table_cell)
+                for y, row_content in enumerate(rows)
+            ]
+        )
         self.parse_width(table, opt)
         self.parse_spanned(table, opt)
-        self.doc.body.append(table)
 
-    def parse_row(self, table, row_content, style_table_row, style_table_cell):
-        """Parse a row level from the input description."""
+    def _parse_row(self, y, row_content, style_table_row, style_table_cell):
+        """Parse a row level from the input description.
+
+        The cells are appended to the row in one batch, the row is returned
+        to be appended to its table at the position y.
+
+        Returns:
+            Row: The generated row.
+        """
         cells, opt = self.split(row_content, ROW)
         style_table_row = self.guess_style(opt, "table-row", style_table_row)
         self.insert_style(style_table_row)
         row = Row(style=style_table_row)
         style_table_cell = self.guess_style(opt, "table-cell", style_table_cell)
-        row = table.append_row(row)
+        parse_cell = self._parse_cell
+        row_cells = []
+        append = row_cells.append
+        previous_empty = _NOT_EMPTY
+        x = 0
         for cell_content in cells:
-            self.parse_cell(row, cell_content, style_table_cell)
+            cell, empty = parse_cell(x, y, cell_content, style_table_cell)
+            x += cell.repeated or 1
+            if empty is not _NOT_EMPTY and empty == previous_empty:
+                # empty cell of the same style as the previous one: merge
+                last_cell = row_cells[-1]
+                last_cell.repeated = (last_cell.repeated or 1) + 1
+            else:
+                append(cell)
+            previous_empty = empty
+        row.extend_cells(row_cells)
+        return row
 
-    def parse_cell(self, row, cell_content, style_table_cell):
-        """Parse a cell level from the input description."""
+    def _parse_cell(self, x, y, cell_content, style_table_cell):
+        """Parse a cell level from the input description.
+
+        A cell is empty if its value is None, without other option than its
+        style. Consecutive empty cells of the same style are merged by the
+        caller into one repeated cell.
+
+        Returns:
+            tuple: The generated cell, to be appended at the position x, y,
+            and its style name if the cell is empty, else _NOT_EMPTY.
+        """
         value, opt = self.split(cell_content, VALUE)
         if style_table_cell:
             default = style_table_cell
-        elif value is None or isinstance(value, str):
-            default = self.defaults["style_str"]
-        elif isinstance(value, int):
-            default = self.defaults["style_int"]
-        elif isinstance(value, float):
-            default = self.defaults["style_float"]
         else:
-            default = self.defaults["style_other"]
+            default = self.type_styles.get(type(value))
+            if default is None:
+                default = self.other_type_style(value)
         style = self.guess_style(opt, "table-cell", default)
-        self.insert_style(style)
+        if style not in self.used_styles:
+            self.insert_style(style)
+        if opt.keys() <= {VALUE}:
+            # minimalist description, a bare value
+            return Cell(value=value, style=style), (
+                style if value is None else _NOT_EMPTY
+            )
+        if value is None and opt.keys() <= _EMPTY_CELL_KEYS:
+            return Cell(style=style), style
         cell = Cell(
             value=value, style=style, text=opt.get(TEXT), formula=opt.get(FORMULA)
         )
-        attr = opt.get("attr")
+        attr = opt.get(ATTR)
         if attr:
+            set_attribute = cell.set_attribute
             for key, value in attr.items():
-                cell.set_attribute(key, value)
-        cell = row.append(cell)
+                set_attribute(key, value)
         if COLSPAN in opt or ROWSPAN in opt:
-            self.store_spanned_cell(cell, opt)
+            self.store_spanned_cell(x, y, opt)
+        return cell, _NOT_EMPTY
+
+    def other_type_style(self, value):
+        """Default style of a value whose type is not in type_styles.
+
+        Args:
+            value (any type): Value of the cell, possibly a subclass of str,
+                int or float.
+
+        Returns:
+            str: Name of the default style.
+        """
+        if isinstance(value, str):
+            return self.defaults["style_str"]
+        if isinstance(value, int):
+            return self.defaults["style_int"]
+        if isinstance(value, float):
+            return self.defaults["style_float"]
+        return self.defaults["style_other"]
 
     def column_width_style(self, width):
         """Generate an ODF style for a column width.
 
+        The style is inserted once per distinct width and then reused.
+
         Args:
             width (str): The required width, any ODF format like "10.5mm".
 
         Returns:
-            str: The XML string of the style.
+            str: The name of the style.
         """
-        return self.doc.insert_style(
-            Element.from_tag(
-                f"""
+        if width not in self.width_styles:
+            self.width_styles[width] = self.doc.insert_style(
+                Element.from_tag(
+                    f"""
                     <style:style style:family="table-column">
                     <style:table-column-properties fo:break-before="auto"
                     style:column-width="{width}"/>
                     </style:style>
                 """
-            ),
-            automatic=True,
-        )
+                ),
+                automatic=True,
+            )
+        return self.width_styles[width]
 
     def parse_width(self, table, opt):
         """Parse the width tag of the input description."""
@@ -853,12 +898,17 @@ class ODSGenerator:
             for position, width in enumerate(width_opt):
                 if width:
                     column = table.get_column(position)
+                    column.repeated = None
                     column.style = self.column_width_style(width)
                     table.set_column(position, column)
             return
-        for position, column in enumerate(table.get_columns()):
-            column.style = self.column_width_style(width_opt)
-            table.set_column(position, column)
+        # same width for all columns: one style, set in place on the columns
+        columns = table.get_elements("table:table-column")
+        if not columns:
+            return
+        style = self.column_width_style(width_opt)
+        for column in columns:
+            column.style = style
 
     def parse_spanned(self, table, opt):
         """Parse the span tag of the input description."""
@@ -866,20 +916,55 @@ class ODSGenerator:
         if span_opt:
             if not isinstance(span_opt, list):
                 span_opt = [span_opt]
-            span_opt.extend(self.spanned_cells)
+            span_opt = span_opt + self.spanned_cells
         else:
             span_opt = self.spanned_cells
         for area in span_opt:
             table.set_span(area)
 
-    def store_spanned_cell(self, cell, opt):
+    def parse_row(self, table, row_content, style_table_row, style_table_cell):
+        """Parse a row level from the input description, append it to table.
+
+        Deprecated: rows are now built by parse_table().
+        """
+        warnings.warn(
+            "ODSGenerator.parse_row() is deprecated, use parse_table()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        row = self._parse_row(
+            table.height, row_content, style_table_row, style_table_cell
+        )
+        table.append_row(row)
+
+    def parse_cell(self, row, cell_content, style_table_cell):
+        """Parse a cell level from the input description, append it to row.
+
+        Deprecated: cells are now built by parse_table().
+        """
+        warnings.warn(
+            "ODSGenerator.parse_cell() is deprecated, use parse_table()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        cell, _empty = self._parse_cell(
+            row.width, row.y or 0, cell_content, style_table_cell
+        )
+        row.append(cell)
+
+    def store_spanned_cell(self, x, y, opt):
+        """Store the area of a cell spanned by colspanned/rowspanned keys.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            opt (dict): Options of the cell.
+        """
         colspan = max(1, int(opt.get(COLSPAN, 1)))
         rowspan = max(1, int(opt.get(ROWSPAN, 1)))
         if colspan < 2 and rowspan < 2:
             return
-        self.spanned_cells.append(
-            [cell.x, cell.y, cell.x + colspan - 1, cell.y + rowspan - 1]
-        )
+        self.spanned_cells.append((x, y, x + colspan - 1, y + rowspan - 1))
 
 
 def content_to_ods(content, output_path):
@@ -893,6 +978,56 @@ def content_to_ods(content, output_path):
     document.save(output_path)
 
 
+@lru_cache(maxsize=1)
+def file_parsers():
+    """Import the optional parsers of input files, on first call only.
+
+    Library users of ods_bytes() do not pay the import of PyYAML.
+
+    Returns:
+        tuple: yaml and orjson modules, None if not installed.
+    """
+    try:
+        import yaml
+    except ModuleNotFoundError:  # pragma: no cover
+        yaml = None
+    try:
+        import orjson
+    except ModuleNotFoundError:  # pragma: no cover
+        orjson = None
+    return yaml, orjson
+
+
+def load_file(input_path):
+    """Load the description of tables from a JSON or YAML file.
+
+    A file with the .json suffix, or any file when PyYAML is not available,
+    is parsed as JSON, with orjson if it is installed, else with json. A
+    .json file that is not strict JSON is then parsed as YAML.
+
+    Args:
+        input_path (str or Path): Path of the file with desription to parse.
+
+    Returns:
+        list or dict: Input description of tables.
+    """
+    yaml, orjson = file_parsers()
+    if not yaml or str(input_path).lower().endswith(".json"):
+        json_loads = orjson.loads if orjson else json.loads
+        with open(input_path, "rb") as file:
+            raw = file.read()
+        try:
+            return json_loads(raw)
+        except ValueError:
+            if not yaml:
+                raise
+            # not strict JSON, let the YAML parser try
+    # use the LibYAML based loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(input_path, encoding="utf8") as file:
+        return yaml.load(file, loader)
+
+
 def file_to_ods(input_path, output_path):
     """Parse the input file and save resulting ODF to file.
 
@@ -902,16 +1037,10 @@ def file_to_ods(input_path, output_path):
         input_path (str or Path): Path of the file with desription to parse.
         output_path (str or Path or BytesIO): Path of the ODF output file.
     """
-    if "yaml" in sys.modules:
-        with open(input_path, encoding="utf8") as file:
-            content = yaml.load(file, yaml.SafeLoader)
-    else:  # fall back to json
-        with open(input_path, encoding="utf8") as file:
-            content = json.load(file)
-    content_to_ods(content, output_path)
+    content_to_ods(load_file(input_path), output_path)
 
 
-def ods_bytes(content):
+def ods_bytes(content, compress=True):
     """Parse the document description and generate an ODF document as bytes.
 
     This is the recommended front-end when odsgenerator is used as a library.
@@ -926,6 +1055,10 @@ def ods_bytes(content):
 
     Args:
         content (list or dict): Input description of tables.
+        compress (bool): If False, the parts of the document are stored
+            without deflate compression, so a consumer of the bytes reads
+            them without inflating. The archive is rewritten for that, which
+            adds to the generation time. Default is True.
 
     Returns:
         bytes: Zipped OpenDocument format.
@@ -933,4 +1066,27 @@ def ods_bytes(content):
     with io.BytesIO() as iobytes:
         document = ODSGenerator(content)
         document.save(iobytes)
+        if compress:
+            return iobytes.getvalue()
+        return stored_zip(iobytes)
+
+
+def stored_zip(source):
+    """Rewrite a zip archive with all its entries stored without compression.
+
+    The order of the entries is kept, so the "mimetype" entry of an ODF
+    document remains the first one.
+
+    Args:
+        source (file-like): Zip archive to read.
+
+    Returns:
+        bytes: The uncompressed zip archive.
+    """
+    with zipfile.ZipFile(source) as src, io.BytesIO() as iobytes:
+        with zipfile.ZipFile(iobytes, "w", zipfile.ZIP_STORED) as dest:
+            for info in src.infolist():
+                stored = zipfile.ZipInfo(info.filename, info.date_time)
+                stored.external_attr = info.external_attr
+                dest.writestr(stored, src.read(info))
         return iobytes.getvalue()
@@ -0,0 +1,18 @@
+import pytest
+from odfdo import Document
+
+from odsgenerator import odsgenerator as og
+
+
+@pytest.fixture(scope="session")
+def build_tables(tmp_path_factory):
+    cache = {}
+
+    def build(source):
+        if source not in cache:
+            dest = tmp_path_factory.mktemp(source.stem) / (source.stem + ".ods")
+            og.file_to_ods(source, dest)
+            cache[source] = Document(dest).body.get_tables()
+        return cache[source]
+
+    return build
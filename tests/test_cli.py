@@ -1,10 +1,12 @@
 import re
 import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from odfdo import Document
 
-from odsgenerator.cli import check_odfdo_version
+from odsgenerator.cli import check_odfdo_version, main
 
 RE_VERS = re.compile(r' *version *= *"(\S+)"$')
 DATA = Path(__file__).parent / "data"
@@ -12,7 +14,7 @@ FILE2 = DATA / "test_minimal.json"
 
 
 def read_proj_version():
-    pyproject = Path("__file__").parent.parent / "pyproject.toml"
+    pyproject = Path(__file__).parent.parent / "pyproject.toml"
     with open(pyproject) as content:
         for line in content:
             if group := RE_VERS.match(line):
@@ -42,36 +44,52 @@ def test_no_param():
     assert err.startswith(b"usage: odsgenerator [-h] [--version]")
 
 
-def test_version():
-    command = ["odsgenerator", "--version"]
-    out, err, exitcode = capture(command)
-    assert exitcode == 0
-    expected = f"odsgenerator {read_proj_version()}".encode()
-    assert out == expected
-    assert err == b""
-
-
-def test_help():
-    command = ["odsgenerator", "--help"]
-    out, err, exitcode = capture(command)
+def test_version(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--version"])
+    out, err = capsys.readouterr()
+    assert exit_info.value.code == 0
+    assert out.strip() == f"odsgenerator {read_proj_version()}"
+    assert err == ""
+
+
+def test_help(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--help"])
+    out, err = capsys.readouterr()
+    assert exit_info.value.code == 0
+    assert err == ""
+    assert "odsgenerator, an .ods generator" in out
+    assert "Usage" in out
+    assert "Arguments" in out
+    assert "Principle" in out
+    assert "Styles" in out
+    assert "decimal6_grid_06pt" in out
+
+
+@pytest.mark.parametrize("option", ["--version", "--help"])
+def test_version_help_without_odfdo(option):
+    code = (
+        "import sys\n"
+        "from odsgenerator.cli import main\n"
+        "try:\n"
+        f"    main([{option!r}])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('odfdo' in sys.modules, 'lxml' in sys.modules, file=sys.stderr)\n"
+    )
+    out, err, exitcode = capture([sys.executable, "-c", code])
     assert exitcode == 0
-    assert err == b""
-    assert b"odsgenerator, an .ods generator" in out
-    assert b"Usage" in out
-    assert b"Arguments" in out
-    assert b"Principle" in out
-    assert b"Styles" in out
-    assert b"decimal6_grid_06pt" in out
+    assert out
+    assert err == b"False False"
 
 
-def test_generate(tmp_path):
+def test_generate(tmp_path, capsys):
     dest = tmp_path / "document.ods"
-    dest.unlink(missing_ok=True)
-    command = ["odsgenerator", str(FILE2), str(dest)]
-    out, err, exitcode = capture(command)
-    assert exitcode == 0
-    assert err == b""
-    assert out == b""
+    main([str(FILE2), str(dest)])
+    out, err = capsys.readouterr()
+    assert err == ""
+    assert out == ""
     assert dest.is_file()
     document = Document(dest)
     assert "spreadsheet" in document.container.mimetype
@@ -0,0 +1,27 @@
+import io
+
+from odfdo import Document
+
+from odsgenerator import odsgenerator as og
+
+
+def test_single_width_applies_to_all_columns():
+    raw = og.ods_bytes([{"width": "2cm", "table": [["a", "b", "c"], [10, 20, 30]]}])
+    table = Document(io.BytesIO(raw)).body.get_tables()[0]
+    columns = table.get_columns()
+    assert len(columns) == 3
+    assert len({column.style for column in columns}) == 1
+    assert all(column.style for column in columns)
+
+
+def test_width_list_applies_per_column():
+    generator = og.ODSGenerator(
+        [{"width": ["2cm", None, "3cm"], "table": [["a", "b", "c", "d"]]}]
+    )
+    columns = generator.doc.body.get_tables()[0].get_columns()
+    assert len(columns) == 4
+    assert columns[0].style
+    assert not columns[1].style
+    assert columns[2].style
+    assert columns[2].style != columns[0].style
+    assert not columns[3].style
@@ -0,0 +1,22 @@
+import pytest
+from odfdo import Row, Table
+
+from odsgenerator import odsgenerator as og
+
+
+def test_parse_row_deprecated():
+    generator = og.ODSGenerator([])
+    table = Table("tab")
+    with pytest.warns(DeprecationWarning):
+        generator.parse_row(table, [1, None, "a"], None, None)
+    assert table.get_values() == [[1, None, "a"]]
+
+
+def test_parse_cell_deprecated():
+    generator = og.ODSGenerator([])
+    row = Row()
+    with pytest.warns(DeprecationWarning):
+        generator.parse_cell(row, 1, None)
+        generator.parse_cell(row, {"value": "a", "style": "bold"}, None)
+    assert row.get_values() == [1, "a"]
+    assert row.get_cell(1).style == "bold"
@@ -1,51 +1,35 @@
 from decimal import Decimal
 from pathlib import Path
 
-from odfdo import Document
-
-from odsgenerator import odsgenerator as og
+import pytest
 
 DATA = Path(__file__).parent / "data"
 FILE4 = DATA / "test_use_case.json"
 
 
-def make_ods_document(path):
-    dest = path / "test_use_case.ods"
-    dest.unlink(missing_ok=True)
-    og.file_to_ods(FILE4, dest)
-    document = Document(dest)
-    return document
-
-
-def document_tables(path):
-    document = make_ods_document(path)
-    tables = document.body.get_tables()
-    return tables
+@pytest.fixture(scope="module")
+def tables(build_tables):
+    return build_tables(FILE4)
 
 
-def test_tables(tmp_path):
-    tables = document_tables(tmp_path)
+def test_tables(tables):
     assert len(tables) == 2
 
 
-def test_t0_name(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_name(tables):
     table = tables[0]
     assert table.name == "Results"
 
 
-def test_t0_rows(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_rows(tables):
     table = tables[0]
     rows = table.get_rows()
     assert len(rows) == 41
 
 
-def test_t0_r0_values(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_r0_values(tables):
     table = tables[0]
-    rows = table.get_rows()
-    row = rows[0]
+    row = table.get_row(0)
     values = row.get_values()
     assert values == [
         "Surface id",
@@ -74,11 +58,9 @@ def test_t0_r0_values(tmp_path):
     ]
 
 
-def test_t0_r15_values(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_r15_values(tables):
     table = tables[0]
-    rows = table.get_rows()
-    row = rows[15]
+    row = table.get_row(15)
     values = row.get_values()
     assert values == [
         92393,
@@ -107,11 +89,9 @@ def test_t0_r15_values(tmp_path):
     ]
 
 
-def test_t0_r40_values(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_r40_values(tables):
     table = tables[0]
-    rows = table.get_rows()
-    row = rows[40]
+    row = table.get_row(40)
     values = row.get_values()
     assert values == [
         106612,
@@ -140,14 +120,12 @@ def test_t0_r40_values(tmp_path):
     ]
 
 
-def test_t1_name(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t1_name(tables):
     table = tables[1]
     assert table.name == "Scale"
 
 
-def test_t1_rows(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t1_rows(tables):
     table = tables[1]
     rows = table.get_rows()
     assert len(rows) == 17
@@ -1,34 +1,21 @@
 from pathlib import Path
 
-from odfdo import Document
-
-from odsgenerator import odsgenerator as og
+import pytest
 
 DATA = Path(__file__).parent / "data"
 FILE5 = DATA / "test_formula.json"
 
 
-def make_ods_document(path):
-    dest = path / "test_formula.ods"
-    dest.unlink(missing_ok=True)
-    og.file_to_ods(FILE5, dest)
-    document = Document(dest)
-    return document
-
-
-def document_tables(path):
-    document = make_ods_document(path)
-    tables = document.body.get_tables()
-    return tables
+@pytest.fixture(scope="module")
+def tables(build_tables):
+    return build_tables(FILE5)
 
 
-def test_tables(tmp_path):
-    tables = document_tables(tmp_path)
+def test_tables(tables):
     assert len(tables) == 1
 
 
-def test_t0_r3_formula(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_r3_formula(tables):
     table = tables[0]
     rows = table.get_rows()
     row = rows[3]
@@ -1,47 +1,32 @@
 from pathlib import Path
 
-from odfdo import Document
-
-from odsgenerator import odsgenerator as og
+import pytest
 
 DATA = Path(__file__).parent / "data"
 FILE_STYLES = DATA / "styles.json"
 
 
-def make_ods_document(path):
-    dest = path / "styles.ods"
-    dest.unlink(missing_ok=True)
-    og.file_to_ods(FILE_STYLES, dest)
-    document = Document(dest)
-    return document
-
-
-def document_tables(path):
-    document = make_ods_document(path)
-    tables = document.body.get_tables()
-    return tables
+@pytest.fixture(scope="module")
+def tables(build_tables):
+    return build_tables(FILE_STYLES)
 
 
-def test_tables(tmp_path):
-    tables = document_tables(tmp_path)
+def test_tables(tables):
     assert len(tables) == 1
 
 
-def test_t0_name(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_name(tables):
     table = tables[0]
     assert table.name == "demo styles"
 
 
-def test_t0_rows(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_rows(tables):
     table = tables[0]
     rows = table.get_rows()
     assert len(rows) == 37
 
 
-def test_t0_r0_values(tmp_path):
-    tables = document_tables(tmp_path)
+def test_t0_r0_values(tables):
     table = tables[0]
     rows = table.get_rows()
     row = rows[0]
@@ -1,5 +1,7 @@
+import json
 from pathlib import Path
 
+import pytest
 from odfdo import Document
 
 from odsgenerator import odsgenerator as og
@@ -14,16 +16,49 @@ FILE5 = DATA / "test_formula.json"
 FILES = (FILE1, FILE2, FILE3, FILE4, FILE5)
 
 
-def test_run(tmp_path):
-    for file in FILES:
-        output = tmp_path / (file.stem + "1.ods")
-        og.file_to_ods(file, output)
-        assert output.is_file()
+@pytest.mark.parametrize("file", FILES, ids=lambda file: file.name)
+def test_run_load(tmp_path, file):
+    output = tmp_path / (file.stem + ".ods")
+    og.file_to_ods(file, output)
+    assert output.is_file()
+    doc = Document(output)
+    assert isinstance(doc, Document)
 
 
-def test_load(tmp_path):
-    for file in FILES:
-        output = tmp_path / (file.stem + "2.ods")
-        og.file_to_ods(file, output)
-        doc = Document(output)
-        assert isinstance(doc, Document)
+def test_load_file_json():
+    with open(FILE1, encoding="utf8") as file:
+        expected = json.load(file)
+    assert og.load_file(FILE1) == expected
+
+
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_load_file_json_semantics(tmp_path, monkeypatch, with_orjson):
+    yaml, orjson = og.file_parsers()
+    if with_orjson and orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(
+        og, "file_parsers", lambda: (yaml, orjson if with_orjson else None)
+    )
+    path = tmp_path / "floats.json"
+    path.write_text("[[[1e5, 2.5E3]]]")
+    assert og.load_file(path) == [[[100000.0, 2500.0]]]
+
+
+def test_load_file_json_not_strict(tmp_path):
+    path = tmp_path / "quotes.json"
+    path.write_text("[[['a', 'b']]]")
+    assert og.load_file(path) == [[["a", "b"]]]
+
+
+def test_content_not_modified():
+    content = {
+        "body": [
+            {
+                "table": [{"row": [{"value": 1, "style": "bold", "colspanned": 2}]}],
+                "span": ["A2:B2"],
+            }
+        ]
+    }
+    expected = json.loads(json.dumps(content))
+    og.ods_bytes(content)
+    assert content == expected
@@ -0,0 +1,37 @@
+import io
+import zipfile
+
+from odfdo import Document
+
+from odsgenerator import odsgenerator as og
+
+CONTENT = [[["a", "b", "c"], [10, 20, 30]]]
+
+
+def test_ods_bytes_compressed():
+    raw = og.ods_bytes(CONTENT)
+    with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+        info = archive.getinfo("content.xml")
+    assert info.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_ods_bytes_not_compressed():
+    raw = og.ods_bytes(CONTENT, compress=False)
+    with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+        infos = archive.infolist()
+        assert (
+            archive.read("mimetype")
+            == b"application/vnd.oasis.opendocument.spreadsheet"
+        )
+    assert infos[0].filename == "mimetype"
+    assert {info.compress_type for info in infos} == {zipfile.ZIP_STORED}
+    table = Document(io.BytesIO(raw)).body.get_table(0)
+    assert table.get_values() == [["a", "b", "c"], [10, 20, 30]]
+
+
+def test_ods_bytes_same_parts():
+    with zipfile.ZipFile(io.BytesIO(og.ods_bytes(CONTENT))) as archive:
+        names = archive.namelist()
+    raw = og.ods_bytes(CONTENT, compress=False)
+    with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+        assert archive.namelist() == names
@@ -0,0 +1,41 @@
+from odsgenerator import odsgenerator as og
+
+
+def first_row(content):
+    generator = og.ODSGenerator(content)
+    return generator.doc.body.get_tables()[0].get_rows()[0]
+
+
+def test_empty_cells_merged():
+    row = first_row([[[1, None, None, None, 2]]])
+    assert row.get_values() == [1, None, None, None, 2]
+    assert len(row.get_elements("table:table-cell")) == 3
+
+
+def test_empty_cells_of_other_style_not_merged():
+    row = first_row([[[None, {"value": None, "style": "bold"}, None]]])
+    assert row.get_values() == [None, None, None]
+    assert len(row.get_elements("table:table-cell")) == 3
+
+
+def test_spanned_empty_cell_among_empty_cells():
+    row = first_row([[[None, {"value": None, "colspanned": 2}, None, None, 1]]])
+    assert row.get_values() == [None, None, None, None, 1]
+    cells = row.get_elements("table:table-cell")
+    assert len(cells) == 4
+    assert cells[1].get_attribute("table:number-columns-spanned") == "2"
+    assert cells[1].get_attribute("table:number-columns-repeated") is None
+    assert len(row.get_elements("table:covered-table-cell")) == 1
+
+
+def test_empty_cells_with_text_not_merged():
+    row = first_row([[[None, {"value": None, "text": "x"}, None]]])
+    assert len(row.get_elements("table:table-cell")) == 3
+    assert row.get_cell(1).text_content == "x"
+
+
+def test_empty_cells_of_same_explicit_style_merged():
+    empty = {"value": None, "style": "bold"}
+    row = first_row([[[empty, empty, None]]])
+    assert row.get_values() == [None, None, None]
+    assert len(row.get_elements("table:table-cell")) == 2
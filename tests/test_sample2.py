@@ -1,3 +1,4 @@
+import io
 from decimal import Decimal
 
 from odfdo import Document
@@ -5,8 +6,7 @@ from odfdo import Document
 from odsgenerator import odsgenerator as og
 
 
-def test_sample1(tmp_path):
-    path = tmp_path / "sample2.ods"
+def test_sample1():
     raw = og.ods_bytes(
         [
             {
@@ -22,10 +22,7 @@ def test_sample1(tmp_path):
             }
         ]
     )
-    with open(path, "wb") as file:
-        file.write(raw)
-    assert path.is_file()
-    document = Document(path)
+    document = Document(io.BytesIO(raw))
     tables = document.body.get_tables()
     table = tables[0]
     rows = table.get_rows()
@@ -1,3 +1,5 @@
+import threading
+
 from odsgenerator import odsgenerator as og
 
 
@@ -23,3 +25,62 @@ def test_style_list4():
     for style in og.DEFAULT_STYLES:
         assert style["definition"] not in known
         known.add(style["definition"])
+
+
+def test_default_styles_reused():
+    content = [{"style": "bold", "table": [["a", 1]]}]
+    generators = [og.ODSGenerator(content) for _ in range(2)]
+    for generator in generators:
+        assert generator.doc.get_style("table-cell", "bold") is not None
+
+
+def test_defaults_not_shared():
+    og.ODSGenerator({"defaults": {"style_int": "bold"}, "body": [[[1]]]})
+    assert og.DEFAULTS_DICT["style_int"] == "right"
+    generator = og.ODSGenerator([[[1]]])
+    assert generator.defaults["style_int"] == "right"
+
+
+def test_default_styles_concurrent_first_use(monkeypatch):
+    monkeypatch.setattr(og, "_default_styles", None)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def first_use():
+        barrier.wait()
+        results.append(og.default_styles())
+
+    threads = [threading.Thread(target=first_use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert len(results[0][0]) == len(og.DEFAULT_STYLES)
+
+
+class StyleName(str):
+    pass
+
+
+def test_style_name_str_subclass():
+    content = {
+        "styles": [
+            {
+                "name": StyleName("my_bold"),
+                "definition": og.DEFAULT_STYLES[2]["definition"],
+            }
+        ],
+        "body": [
+            [
+                [
+                    {"value": "x", "style": StyleName("bold")},
+                    {"value": "y", "style": StyleName("my_bold")},
+                ]
+            ]
+        ],
+    }
+    generator = og.ODSGenerator(content)
+    cells = generator.doc.body.get_tables()[0].get_rows()[0].get_cells()
+    assert [cell.style for cell in cells] == ["bold", "my_bold"]
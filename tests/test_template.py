@@ -0,0 +1,14 @@
+from odsgenerator import odsgenerator as og
+
+
+def test_generators_do_not_share_tables():
+    first = og.ODSGenerator([[["a"]], [["b"]]])
+    second = og.ODSGenerator([[["c"]]])
+    assert len(first.doc.body.get_tables()) == 2
+    assert len(second.doc.body.get_tables()) == 1
+
+
+def test_template_not_modified():
+    template = og.spreadsheet_template().body.serialize()
+    og.ODSGenerator([[["a"]], [["b"]]])
+    assert og.spreadsheet_template().body.serialize() == template